@@ -10,20 +10,55 @@ st.set_page_config(
     layout="wide"
 )
 
-@st.cache_data
-def load_data(file_path):
-    """CSV 파일을 로드하고 전처리합니다."""
+# CSV 파일의 컬럼 순서 (원본 헤더 대신 이 이름을 사용)
+COLUMNS = [
+    '접수년도', '자치구코드', '자치구명', '법정동코드', '법정동명', '지번구분코드', '지번구분', '본번',
+    '부번', '층', '계약일', '전월세구분', '임대면적', '보증금(만원)', '임대료(만원)', '건물명',
+    '건축년도', '건물용도', '계약기간', '신규계약구분', '갱신청구권사용', '종전보증금', '종전임대료'
+]
+
+# 전처리(load_data)에 항상 필요한 컬럼
+BASE_COLUMNS = ('전월세구분', '보증금(만원)', '임대료(만원)')
+
+# 페이지별로 사용하는 컬럼 (BASE_COLUMNS 외). 모든 페이지가 하나의 캐시된 데이터를 공유하므로
+# 실제로는 이들의 합집합(LOADED_COLUMNS)만 한 번 읽고, 여기에 없는 컬럼은 읽지 않습니다.
+# 상세 테이블 등에서 가끔 필요한 컬럼은 load_columns 로 필요한 행만 그때그때 불러옵니다.
+PAGE_COLUMNS = {
+    'home': ('자치구명', '법정동명', '임대면적'),
+    'analysis': ('자치구명', '법정동명', '건물용도', '임대면적'),
+    'comparative': ('자치구명', '법정동명', '건물용도', '임대면적'),
+    'risk': ('자치구명', '법정동명', '건물용도', '임대면적', '건축년도'),
+}
+LOADED_COLUMNS = tuple(
+    col for col in COLUMNS
+    if col in BASE_COLUMNS or any(col in cols for cols in PAGE_COLUMNS.values())
+)
+
+def read_columns(file_path, columns, rows=None):
+    """CSV 파일에서 지정한 컬럼(과 행)만 읽어옵니다 (행 인덱스는 원본 행 번호)."""
+    usecols = sorted(COLUMNS.index(col) for col in set(columns))
+    skiprows = None
+    if rows is not None:
+        # 파일의 0번째 줄은 헤더이므로 원본 행 번호 r 은 r + 1 번째 줄
+        keep = set(rows)
+        skiprows = lambda line: line > 0 and line - 1 not in keep
+
     try:
-        data = pd.read_csv(file_path, encoding='utf-8')
+        data = pd.read_csv(file_path, encoding='utf-8', usecols=usecols, skiprows=skiprows)
     except UnicodeDecodeError:
-        data = pd.read_csv(file_path, encoding='euc-kr') # 다른 인코딩 시도
-
-    # 컬럼명 정리 및 전처리
-    data.columns = [
-        '접수년도', '자치구코드', '자치구명', '법정동코드', '법정동명', '지번구분코드', '지번구분', '본번',
-        '부번', '층', '계약일', '전월세구분', '임대면적', '보증금(만원)', '임대료(만원)', '건물명',
-        '건축년도', '건물용도', '계약기간', '신규계약구분', '갱신청구권사용', '종전보증금', '종전임대료'
-    ]
+        data = pd.read_csv(file_path, encoding='euc-kr', usecols=usecols, skiprows=skiprows) # 다른 인코딩 시도
+
+    # 컬럼명 정리 (usecols 는 파일 순서대로 반환됨)
+    data.columns = [COLUMNS[i] for i in usecols]
+    if rows is not None:
+        data.index = sorted(keep)
+    return data
+
+@st.cache_data
+def load_data(file_path):
+    """CSV 파일에서 대시보드가 사용하는 컬럼(LOADED_COLUMNS)만 로드하고 전처리합니다."""
+    data = read_columns(file_path, LOADED_COLUMNS)
+
     # 숫자로 변환 (오류 발생 시 NaN 처리 후 0으로 채움)
     data['보증금(만원)'] = pd.to_numeric(data['보증금(만원)'], errors='coerce').fillna(0)
     data['임대료(만원)'] = pd.to_numeric(data['임대료(만원)'], errors='coerce').fillna(0)
@@ -34,6 +69,14 @@ def load_data(file_path):
     
     return data
 
+@st.cache_data
+def load_columns(file_path, columns, rows):
+    """자주 쓰이지 않는 컬럼을 필요한 행(rows, 원본 행 번호)에 대해서만 불러옵니다.
+
+    인덱스가 load_data 결과와 같은 원본 행 번호이므로 `df.join(load_columns(...))` 로 붙일 수 있습니다.
+    """
+    return read_columns(file_path, columns, rows)
+
 # 데이터를 로드하여 모든 페이지에서 사용
 FILE_PATH = "seoul.csv"
 df = load_data(FILE_PATH)
@@ -2,6 +2,7 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import plotly.express as px
 
@@ -35,6 +36,13 @@ gu_B = st.sidebar.multiselect("B: 자치구", options=gu_options, default=gu_opt
 type_B = st.sidebar.selectbox("B: 전월세 구분", options=type_options, index=2, key='type_B')
 bld_B = st.sidebar.multiselect("B: 건물 용도", options=building_options, default=building_options[2:4], key='bld_B')
 
+st.sidebar.markdown("---")
+
+# --- 부트스트랩 신뢰구간 설정 ---
+st.sidebar.header("신뢰구간 설정 (부트스트랩)")
+n_resamples = st.sidebar.select_slider("재표본 횟수", options=[500, 1000, 2000, 5000], value=2000, key='n_resamples')
+confidence = st.sidebar.select_slider("신뢰수준", options=[0.90, 0.95, 0.99], value=0.95, format_func=lambda x: f"{x:.0%}", key='confidence')
+
 # --- 데이터 필터링 함수 ---
 def filter_group(df, gu_list, type_val, bld_list):
     df_filtered = df[df['자치구명'].isin(gu_list)]
@@ -88,6 +96,120 @@ kpi_B = calculate_kpis(filtered_B_df, 'Group B')
 
 comparison_df = pd.DataFrame([kpi_A, kpi_B]).set_index('그룹')
 
+
+# --- 2-1. 그룹 간 차이의 부트스트랩 신뢰구간 ---
+
+# 한 번에 생성하는 재표본 행렬의 최대 원소 수 (메모리 상한, 약 수십 MB)
+BOOTSTRAP_MAX_ELEMENTS = 4_000_000
+# 재표본 크기 상한: 이보다 큰 그룹은 m-out-of-n 부트스트랩 후 sqrt(m/n)으로 보정
+BOOTSTRAP_MAX_SAMPLE = 2_000
+# 그룹당 전체 추출 수(재표본 횟수 × 재표본 크기 × 지표 수) 상한 (응답 시간 제한)
+BOOTSTRAP_MAX_DRAWS = 8_000_000
+# 이보다 작은 그룹은 유의 여부를 판단하지 않음
+BOOTSTRAP_MIN_VERDICT_SIZE = 10
+BOOTSTRAP_SEED = 42
+
+# 신뢰구간을 계산할 지표: (표시 이름, 컬럼, 월세만 사용 여부)
+CI_METRICS = [
+    ('평균 보증금 (만원)', '보증금(만원)', False),
+    ('평균 월 임대료 (만원)', '임대료(만원)', True),
+    ('평균 면적 (㎡)', '임대면적', False),
+    ('면적당 보증금 효율 (만원/㎡)', '면적당_보증금', False),
+]
+
+def bootstrap_statistics(values, n_resamples, rng, sample_size, max_elements=BOOTSTRAP_MAX_ELEMENTS):
+    """(n, k) 배열에서 sample_size 개씩 복원추출한 재표본들의 평균/중앙값을 (n_resamples, k) 배열로 반환합니다.
+
+    Python 반복문 대신 재표본 인덱스를 (청크 크기, sample_size) 행렬로 한 번에 뽑아 계산하며,
+    청크 크기는 max_elements 에 맞춰 조절하여 메모리 사용량을 제한합니다.
+    같은 인덱스를 모든 지표에 사용하고, 지표별로 연속된 (청크 크기, sample_size) 블록에서 계산합니다.
+    """
+    n, k = values.shape
+    columns = np.ascontiguousarray(values.T)  # (k, n)
+    chunk = max(1, max_elements // sample_size)
+    means = np.empty((n_resamples, k))
+    medians = np.empty((n_resamples, k))
+
+    for start in range(0, n_resamples, chunk):
+        stop = min(start + chunk, n_resamples)
+        idx = rng.integers(0, n, size=(stop - start, sample_size), dtype=np.int32 if n < 2**31 else np.int64)
+        for j in range(k):
+            samples = columns[j][idx]  # (청크 크기, sample_size)
+            means[start:stop, j] = samples.mean(axis=1)
+            # 정렬 결과가 필요 없으므로 복사본 대신 samples 자체를 부분 정렬
+            medians[start:stop, j] = np.median(samples, axis=1, overwrite_input=True)
+
+    return means, medians
+
+@st.cache_data
+def bootstrap_diff_ci(values_a, values_b, n_resamples, confidence, seed=BOOTSTRAP_SEED):
+    """그룹 A - B 의 평균 차이/중앙값 차이에 대한 백분위수 부트스트랩 신뢰구간을 계산합니다."""
+    # 그룹별로 독립적이면서도 재현 가능한 난수 생성기
+    seqs = np.random.SeedSequence(seed).spawn(2)
+
+    boot = []
+    for values, seq in zip((values_a, values_b), seqs):
+        n, k = values.shape
+        m = max(1, min(n, BOOTSTRAP_MAX_SAMPLE, BOOTSTRAP_MAX_DRAWS // (n_resamples * k)))
+        mean, median = values.mean(axis=0), np.median(values, axis=0)
+        means, medians = bootstrap_statistics(values, n_resamples, np.random.default_rng(seq), m)
+        # 재표본 크기를 줄인 경우 분산 차이를 sqrt(m/n)으로 보정 (m == n 이면 그대로)
+        scale = np.sqrt(m / n)
+        boot.append((mean, median, mean + scale * (means - mean), median + scale * (medians - median)))
+
+    (mean_a, median_a, means_a, medians_a), (mean_b, median_b, means_b, medians_b) = boot
+    q = [(1 - confidence) / 2 * 100, (1 + confidence) / 2 * 100]
+    return {
+        'mean_diff': mean_a - mean_b,
+        'mean_ci': np.percentile(means_a - means_b, q, axis=0),
+        'median_diff': median_a - median_b,
+        'median_ci': np.percentile(medians_a - medians_b, q, axis=0),
+    }
+
+def build_ci_table(data_a, data_b, n_resamples, confidence):
+    """지표별 그룹 A - B 차이와 신뢰구간을 표 형태로 정리합니다."""
+    rows = []
+    for monthly_only in (False, True):
+        metrics = [(label, col) for label, col, m in CI_METRICS if m == monthly_only]
+        sub_a = data_a[data_a['전월세구분'] == '월세'] if monthly_only else data_a
+        sub_b = data_b[data_b['전월세구분'] == '월세'] if monthly_only else data_b
+        # 재표본 분포를 만들려면 그룹마다 최소 2건이 필요
+        if len(sub_a) < 2 or len(sub_b) < 2:
+            continue
+
+        cols = [col for _, col in metrics]
+        result = bootstrap_diff_ci(
+            sub_a[cols].to_numpy(dtype=float), sub_b[cols].to_numpy(dtype=float),
+            n_resamples, confidence
+        )
+        for i, (label, _) in enumerate(metrics):
+            mean_lo, mean_hi = result['mean_ci'][:, i]
+            median_lo, median_hi = result['median_ci'][:, i]
+            # 표본이 너무 작거나 구간 폭이 0이면 (값이 모두 같은 경우 등) 판단하지 않음
+            if min(len(sub_a), len(sub_b)) < BOOTSTRAP_MIN_VERDICT_SIZE or mean_lo == mean_hi:
+                verdict = '표본 부족'
+            else:
+                verdict = '예' if mean_lo > 0 or mean_hi < 0 else '아니오'
+            rows.append({
+                '지표': label,
+                '평균 차이 (A-B)': result['mean_diff'][i],
+                '평균 차이 하한': mean_lo,
+                '평균 차이 상한': mean_hi,
+                '중앙값 차이 (A-B)': result['median_diff'][i],
+                '중앙값 차이 하한': median_lo,
+                '중앙값 차이 상한': median_hi,
+                # 신뢰구간이 0을 포함하지 않으면 의미 있는 차이로 판단
+                '평균 차이 유의': verdict,
+            })
+
+    if not rows:
+        return pd.DataFrame()
+
+    # CI_METRICS 에 정의된 순서대로 정렬
+    order = [label for label, _, _ in CI_METRICS]
+    rows.sort(key=lambda row: order.index(row['지표']))
+    return pd.DataFrame(rows).set_index('지표')
+
 # --- 3. 비교 결과 시각화 및 표시 ---
 
 st.header("1. 그룹별 핵심 지표 비교")
@@ -130,6 +252,21 @@ else:
     )
     st.plotly_chart(fig_comp, use_container_width=True)
 
+    # 3-3. 그룹 간 차이의 신뢰구간 (부트스트랩)
+    st.subheader(f"그룹 A - B 차이의 {confidence:.0%} 신뢰구간")
+    st.markdown(
+        f"각 그룹을 **{n_resamples:,}회 복원추출(부트스트랩)**하여 평균·중앙값 차이의 신뢰구간을 추정합니다. "
+        "구간이 0을 포함하지 않으면 두 그룹의 차이가 우연이 아닐 가능성이 높습니다."
+    )
+
+    ci_df = build_ci_table(filtered_A_df, filtered_B_df, n_resamples, confidence)
+    if ci_df.empty:
+        st.info("두 그룹 모두 2건 이상의 계약이 있어야 신뢰구간을 계산할 수 있습니다.")
+    else:
+        st.dataframe(ci_df.style.format({
+            col: '{:,.2f}' for col in ci_df.columns if col != '평균 차이 유의'
+        }))
+
 st.markdown("---")
 
 # --- 4. 가격 결정 요인 분석 (산점도) ---
@@ -7,7 +7,7 @@ import numpy as np
 from datetime import datetime
 
 # app.py에서 정의한 load_data 함수를 import합니다.
-from app import load_data 
+from app import load_data, load_columns
 
 # 데이터 로드
 df = load_data("seoul.csv")
@@ -76,7 +76,10 @@ if not risk_df.empty and len(risk_df) > 10:
     if not outliers.empty:
         st.subheader("🚨 위험 거래 경고 (통계적 이상치 Top 5)")
         st.warning("경고: 해당 거래는 시장 평균 대비 **매우 높은 가격**에 형성된 것으로 보입니다. 가격 리스크를 확인하세요.")
-        st.dataframe(outliers[['법정동명', '임대면적', price_col, '임대료(만원)', '건물용도', '건축년도']].head(5))
+        # 건물명/층은 이 테이블에서만 쓰이므로 필요할 때만 불러와 붙임
+        top_outliers = outliers.head(5)
+        top_outliers = top_outliers.join(load_columns("seoul.csv", ('건물명', '층'), tuple(top_outliers.index)))
+        st.dataframe(top_outliers[['법정동명', '건물명', '층', '임대면적', price_col, '임대료(만원)', '건물용도', '건축년도']])
     else:
         st.info("해당 지역에서는 통계적으로 유의미한 가격 이상 거래가 발견되지 않았습니다.")
         